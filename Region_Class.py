@@ -1,9 +1,209 @@
-import copy
-import random
 import warnings
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.patches as mp
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError: # Fall back to pure Python / NumPy
+    HAS_NUMBA = False
+    prange = range
+    def njit(*args, **kwargs):
+        '''
+        Stand-in for numba.njit when numba is not installed, leaves function as is
+        '''
+        if len(args) == 1 and callable(args[0]): return args[0]
+        return lambda func: func
+
+@njit('void(i8[::1], i8, i8[::1], i8[::1])', cache=True, fastmath=True)
+def _largest_hist_area(hist, n, stack, out):
+    '''
+    Jitted kernel of Region.largest_hist_area (monotonic stack)
+    Compiled eagerly for contiguous int64 buffers
+    
+    params:
+        hist: np.ndarray int64 (height of blank area for each column,
+              hist[n] must be 0 as the sentinel)
+        n: int, number of columns
+        stack: np.ndarray int64 of length >= n+1 (scratch buffer)
+        out: np.ndarray int64 of length 4, filled with
+             max_area, save_idx, save_h, save_w (same meaning as largest_hist_area)
+    '''
+    top = 0
+    stack[0] = -1
+    out[0] = 0
+    out[1] = -1
+    out[2] = -1
+    out[3] = -1
+    for i in range(n+1):
+        cur = hist[i]
+        while stack[top] != -1 and cur < hist[stack[top]]:
+            h = hist[stack[top]]
+            top -= 1
+            w = i - stack[top] - 1
+            if h * w > out[0]:
+                out[0] = h * w
+                out[1] = i
+                out[2] = h
+                out[3] = w
+        if i < n:
+            top += 1
+            stack[top] = i
+
+@njit(cache=True)
+def _hist_rectangle(out):
+    '''
+    Convert the result of _largest_hist_area into a rectangle for one row
+    Shared by _find_max_rectangle and _find_max_rectangle_numpy
+    
+    param:
+        out: np.ndarray int64 of length 4 (filled by _largest_hist_area)
+    return:
+        area, start_idx, height, width: area and right column of the rectangle,
+                                        height and width minus 1
+    '''
+    if out[0] == 0:
+        return 0, 0, 0, 0
+    return out[0], out[1]-1, out[2]-1, out[3]-1
+
+@njit(cache=True, fastmath=True)
+def _find_max_rectangle(np_map, hist, stack):
+    '''
+    Jitted kernel of Region.find_max_rectangle
+    Column heights are updated incrementally row by row, so one pass is O(m*n)
+    
+    params:
+        np_map: np.ndarray 2-D integer (target area)
+        hist, stack: np.ndarray int64 of length >= np_map.shape[1]+1 (scratch buffers)
+    return:
+        xmin, xmax, ymin, ymax: relative location of maximal blank rectangular area
+    '''
+    m, n = np_map.shape
+    hist[:n+1] = 0
+    out = np.empty(4, dtype=np.int64)
+    maxArea = -1
+    xmin_ref, xmax_ref, ymin_ref, ymax_ref = 0, 0, 0, 0
+    for i in range(m):
+        row = np_map[i]
+        for j in range(n):
+            hist[j] = 0 if row[j] != 0 else hist[j]+1
+        
+        # Get largest rectangular area in this line's histogram
+        _largest_hist_area(hist, n, stack, out)
+        area, start_idx, height, width = _hist_rectangle(out)
+        if area > maxArea:
+            maxArea = area
+            xmax_ref = i
+            ymax_ref = start_idx
+            xmin_ref = xmax_ref - height
+            ymin_ref = ymax_ref - width
+    return xmin_ref, xmax_ref, ymin_ref, ymax_ref
+
+def _find_max_rectangle_numpy(np_map, hist, stack):
+    '''
+    Pure NumPy version of _find_max_rectangle, used when numba is not installed
+    Each row of column heights is updated with one vectorized operation
+    
+    params:
+        np_map: np.ndarray 2-D integer (target area)
+        hist, stack: np.ndarray int64 of length >= np_map.shape[1]+1 (scratch buffers)
+    return:
+        xmin, xmax, ymin, ymax: relative location of maximal blank rectangular area
+    '''
+    m, n = np_map.shape
+    hist[:n+1] = 0
+    heights = hist[:n]
+    out = np.empty(4, dtype=np.int64)
+    maxArea = -1
+    xmin_ref, xmax_ref, ymin_ref, ymax_ref = 0, 0, 0, 0
+    for i in range(m):
+        blank = np_map[i] == 0
+        heights *= blank
+        heights += blank
+        
+        # Get largest rectangular area in this line's histogram
+        _largest_hist_area(hist, n, stack, out)
+        area, start_idx, height, width = _hist_rectangle(out)
+        if area > maxArea:
+            maxArea = area
+            xmax_ref = i
+            ymax_ref = start_idx
+            xmin_ref = xmax_ref - height
+            ymin_ref = ymax_ref - width
+    return xmin_ref, xmax_ref, ymin_ref, ymax_ref
+
+@njit(cache=True)
+def _run_single(map_buf, hist, stack, max_try, n_tower, final_cover):
+    '''
+    Jitted version of one Region.auto_fill experiment on a blank map
+    Towers are drawn from numba's np.random state (seed it before calling)
+    
+    params:
+        map_buf: np.ndarray int32 2-D (blank map, filled in place)
+        hist, stack: np.ndarray int64 of length >= map_buf.shape[1]+1 (scratch buffers)
+        max_try, n_tower, final_cover: same as Region.auto_fill
+    return:
+        try_count, tower_num, cover: number of tries, final number of towers and coverage
+    '''
+    x_range, y_range = map_buf.shape
+    max_tower = x_range * y_range
+    try_count = 0
+    tower_num = 0
+    cover = 0
+    while try_count < max_try:
+        # Check finish condition
+        if tower_num == max_tower or tower_num == n_tower or final_cover <= cover:
+            break
+        
+        # Generate tower position and coverage randomly
+        x = np.random.randint(0, x_range)
+        y = np.random.randint(0, y_range)
+        size_x = np.random.randint(1, x_range-x+1)
+        size_y = np.random.randint(1, y_range-y+1)
+        try_count += 1
+        
+        # One tower cover all area is not permitted
+        if size_x == x_range and size_y == y_range: continue
+        target_area = map_buf[x:x+size_x, y:y+size_y]
+        if target_area.all(): continue
+        
+        # Trim and add tower (no trimming needed for blank target area)
+        if not target_area.any():
+            xmin, xmax, ymin, ymax = 0, size_x-1, 0, size_y-1
+        else:
+            xmin, xmax, ymin, ymax = _find_max_rectangle(target_area, hist, stack)
+        tower_num += 1
+        map_buf[x+xmin:x+xmax+1, y+ymin:y+ymax+1] = tower_num
+        cover += (xmax-xmin+1) * (ymax-ymin+1)
+    return try_count, tower_num, cover
+
+@njit(cache=True, parallel=True)
+def _batch_experiment(seeds, x_range, y_range, try_limit, tower_limit, desired_cover):
+    '''
+    Run independent _run_single experiments in parallel, one per seed
+    
+    params:
+        seeds: np.ndarray int64 (seed of np.random for each experiment)
+        x_range, y_range: int, size of region
+        try_limit, tower_limit, desired_cover: same as Region.batch_experiment
+    return:
+        num_try_record, num_tower_record, coverage_record: np.ndarray int64
+    '''
+    n_exp = seeds.shape[0]
+    num_try_record = np.empty(n_exp, dtype=np.int64)
+    num_tower_record = np.empty(n_exp, dtype=np.int64)
+    coverage_record = np.empty(n_exp, dtype=np.int64)
+    for count in prange(n_exp):
+        np.random.seed(seeds[count])
+        map_buf = np.zeros((x_range, y_range), dtype=np.int32)
+        hist = np.empty(y_range+1, dtype=np.int64)
+        stack = np.empty(y_range+1, dtype=np.int64)
+        n_try, n_tower, cover = _run_single(map_buf, hist, stack,
+                                            try_limit, tower_limit, desired_cover)
+        num_try_record[count] = n_try
+        num_tower_record[count] = n_tower
+        coverage_record[count] = cover
+    return num_try_record, num_tower_record, coverage_record
 
 class Region(object):
     '''
@@ -11,7 +211,12 @@ class Region(object):
     
     Data:
         x_range, y_range: int, the size of rectangular overall communication network
-        map: np.ndarray, the map of communication network contains coverage situation
+        map: np.ndarray int32, the map of communication network contains coverage situation
+             (0 for blank area, otherwise index of the covering tower)
+        tower_x, tower_y: np.ndarray int32, bottom left point of each tower
+        rect_w, rect_h: np.ndarray int32, size of each tower's rectangular subsection
+                        (only the first get_tower_num() entries are valid)
+        rng: np.random.Generator, source of random towers in auto_fill
     '''
     def __init__(self, m, n):
         '''
@@ -26,12 +231,39 @@ class Region(object):
         
         self.x_range = m
         self.y_range = n
-        self.map = np.zeros((self.x_range,self.y_range))
+        self.map = np.zeros((self.x_range,self.y_range), dtype=np.int32)
         
         self.max_tower = m * n
         self.max_coverage = m * n
-        self.tower = []
-        self.sub_rectangle = []
+        
+        # Towers are stored column-wise, preallocated for max_tower towers
+        self.tower_x = np.empty(self.max_tower, dtype=np.int32)
+        self.tower_y = np.empty(self.max_tower, dtype=np.int32)
+        self.rect_w = np.empty(self.max_tower, dtype=np.int32)
+        self.rect_h = np.empty(self.max_tower, dtype=np.int32)
+        self._n = 0
+        self._covered = 0 # Covered area, kept up to date by _add_tower_core
+        
+        # Random generator used by auto_fill
+        self.rng = np.random.default_rng()
+        
+        # Scratch buffers reused by find_max_rectangle
+        self._hist = np.empty(n+1, dtype=np.int64)
+        self._stack = np.empty(n+1, dtype=np.int64)
+        
+    @property
+    def tower(self):
+        '''
+        List of (x, y), the bottom left point of each tower
+        '''
+        return list(zip(self.tower_x[:self._n].tolist(), self.tower_y[:self._n].tolist()))
+    
+    @property
+    def sub_rectangle(self):
+        '''
+        List of (width, height), the size of each tower's rectangular subsection
+        '''
+        return list(zip(self.rect_w[:self._n].tolist(), self.rect_h[:self._n].tolist()))
         
     def show_map(self, size = 5, text = False, font_size = 10):
         '''
@@ -53,31 +285,29 @@ class Region(object):
         plt.figure(figsize = (size,size))
         plt.xlim(xmin = 0, xmax = self.x_range)
         plt.ylim(ymin = 0, ymax = self.y_range)
-        if self.get_tower_num() == 0: return # No tower
+        n_tower = self.get_tower_num()
+        if n_tower == 0: return # No tower
         
         # Plot with different color for each tower
-        np.random.seed(233)
+        colors = np.random.default_rng(233).random((n_tower,3))
+        tx, ty = self.tower_x[:n_tower].tolist(), self.tower_y[:n_tower].tolist()
+        rw, rh = self.rect_w[:n_tower].tolist(), self.rect_h[:n_tower].tolist()
         ax = plt.subplot()
-        for i in range(self.get_tower_num()):
-            random_color = np.random.random(3)
+        for i in range(n_tower):
             ax.add_patch(
                 mp.Rectangle(
-                    (self.tower[i][0],self.tower[i][1]),
-                     self.sub_rectangle[i][0],self.sub_rectangle[i][1],
+                    (tx[i],ty[i]),
+                     rw[i],rh[i],
                      alpha = 0.3,
-                     color = random_color)
+                     color = colors[i])
             )
                 
-        if text: # If text is set to be printed
-            for num in range(self.get_tower_num()):
-                for i in range(self.tower[num][0],
-                               self.tower[num][0]+self.sub_rectangle[num][0]):
-                    for j in range(self.tower[num][1],
-                                   self.tower[num][1]+self.sub_rectangle[num][1]):
-                        plt.text(i+0.5,j+0.5,num+1,
-                         horizontalalignment='center',
-                         verticalalignment='center',
-                         fontsize = font_size)
+        if text: # If text is set to be printed, one label at the center of each tower
+            for num in range(n_tower):
+                ax.text(tx[num]+rw[num]/2, ty[num]+rh[num]/2, str(num+1),
+                        horizontalalignment='center',
+                        verticalalignment='center',
+                        fontsize = font_size)
                     
         plt.show()
 
@@ -101,60 +331,88 @@ class Region(object):
         assert size_x>0 and x+size_x<=self.x_range, "Please set size_x > 0 and x+size_x <= "+str(self.x_range)
         assert size_y>0 and y+size_y<=self.y_range, "Please set size_y > 0 and y+size_y <= "+str(self.y_range)
         
+        # Plotting is kept out of _add_tower_core, which is the hot path of auto_fill
+        if not show_overlap:
+            self._add_tower_core(x, y, size_x, size_y)
+            return
+        
         # One tower cover all area is not permitted
         if size_x == self.x_range and size_y == self.y_range: return
         
-        # Get target area
-        target_area = self.map[x:x+size_x, y:y+size_y]
+        # Show the map before and after trimming
+        self.add_tower_plot(x, y, size_x, size_y, text)
+        self._add_tower_core(x, y, size_x, size_y)
+        self.show_map()
         
-        # If needed, show the map before and after trimming
-        if show_overlap:
-            np.random.seed(233)
-            plt.figure(figsize = (5,5))
-            plt.xlim(xmin = 0, xmax = self.x_range)
-            plt.ylim(ymin = 0, ymax = self.y_range)
-            ax = plt.subplot()
-            for i in range(len(self.tower)):
-                random_color = np.random.random(3)
-                ax.add_patch(
-                    mp.Rectangle(
-                        (self.tower[i][0],self.tower[i][1]),
-                         self.sub_rectangle[i][0],self.sub_rectangle[i][1],
-                         alpha = 0.3,
-                         color = random_color)
-                )
-                
-            random_color = np.random.random(3)
-            ax.add_patch(mp.Rectangle((x,y),size_x,size_y,alpha=0.3))
-            
-            if text: # If text is set to be printed
-                for i in range(x,x+size_x):
-                    for j in range(y,y+size_y):
-                        plt.text(i+0.5,j+0.5,self.get_tower_num()+1,
-                         horizontalalignment='center',
-                         verticalalignment='center',
-                         fontsize = 10)
+    def add_tower_plot(self, x, y, size_x, size_y, text = False):
+        '''
+        Plot current towers together with the new tower's untrimmed rectangular area
+        Used by add_tower when show_overlap is set
+        
+        params:
+            x, y: The position of new tower
+            size_x, size_y: define size of rectangular area
+            text: bool (optional) decide whether to show text or not.
+        '''
+        plt.figure(figsize = (5,5))
+        plt.xlim(xmin = 0, xmax = self.x_range)
+        plt.ylim(ymin = 0, ymax = self.y_range)
+        n_tower = self.get_tower_num()
+        colors = np.random.default_rng(233).random((n_tower,3))
+        tx, ty = self.tower_x[:n_tower].tolist(), self.tower_y[:n_tower].tolist()
+        rw, rh = self.rect_w[:n_tower].tolist(), self.rect_h[:n_tower].tolist()
+        ax = plt.subplot()
+        for i in range(n_tower):
+            ax.add_patch(
+                mp.Rectangle(
+                    (tx[i],ty[i]),
+                     rw[i],rh[i],
+                     alpha = 0.3,
+                     color = colors[i])
+            )
             
-            plt.show()
+        ax.add_patch(mp.Rectangle((x,y),size_x,size_y,alpha=0.3))
+        
+        if text: # If text is set to be printed, one label at the center of new tower
+            ax.text(x+size_x/2, y+size_y/2, str(n_tower+1),
+                    horizontalalignment='center',
+                    verticalalignment='center',
+                    fontsize = 10)
+        
+        plt.show()
+        
+    def _add_tower_core(self, x, y, size_x, size_y):
+        '''
+        Trim and add new tower without any check or plot
+        Parameters are assumed to be validated (see add_tower)
+        '''
+        # One tower cover all area is not permitted
+        if size_x == self.x_range and size_y == self.y_range: return
+        
+        # Get target area
+        target_area = self.map[x:x+size_x, y:y+size_y]
         
         # Check blank area for new tower
-        if np.sum((target_area == 0)) == 0:
-            if show_overlap: self.show_map()
-            pass # No un-covered area in target area, cannot add new tower's subsection
+        if target_area.all():
+            return # No un-covered area in target area, cannot add new tower's subsection
+        
+        if not target_area.any():
+            # Blank target area, new tower keeps its whole subsection
+            xmin, xmax, ymin, ymax = x, x+size_x-1, y, y+size_y-1
         else:
             # Trim: find maximal blank area for adding new tower's subsection
             max_loc = self.find_max_rectangle(target_area)
             xmin, xmax, ymin, ymax = max_loc[0]+x, max_loc[1]+x, max_loc[2]+y, max_loc[3]+y
 
-            # Add tower and its subsection
-            for i in range(xmin,xmax+1):
-                for j in range(ymin,ymax+1):
-                    self.map[i][j] = self.get_tower_num() + 1
-                    
-            # Store information in class
-            self.tower.append((xmin,ymin))
-            self.sub_rectangle.append((xmax-xmin+1,ymax-ymin+1))
-            if show_overlap: self.show_map()
+        # Add tower and its subsection
+        n = self._n
+        self.map[xmin:xmax+1, ymin:ymax+1] = n + 1
+                
+        # Store information in class
+        self.tower_x[n], self.tower_y[n] = xmin, ymin
+        self.rect_w[n], self.rect_h[n] = xmax-xmin+1, ymax-ymin+1
+        self._n = n + 1
+        self._covered += (xmax-xmin+1) * (ymax-ymin+1)
         
     def find_max_rectangle(self, np_map):
         '''
@@ -175,46 +433,19 @@ class Region(object):
             maximal blank rectangular area in target area
             xmin, xmax, ymin, ymax: corresponded location
         '''
-        assert isinstance(np_map,np.ndarray)
         assert len(np_map)>0, "Your target area includes nothing"
-
-        maxArea = -1
-        # Search line by line to crreate histogram
-        for i in range(len(np_map)):
-            row_hist = []
-            
-            # Count histogram and save into row_list
-            for j in range(len(np_map[i])):
-                if i==0: 
-                    if np_map[i][j] == 0:
-                        row_hist.append(1) 
-                    else:
-                        row_hist.append(0)
-                else:
-                    if np_map[i][j]!=0:
-                        row_hist.append(0)
-                    else:
-                        # Count height for each column in one row
-                        tmp = 0
-                        for k in range(i,-1,-1):
-                            if np_map[k][j] != 0: 
-                                break
-                            else:
-                                tmp += 1
-                        row_hist.append(tmp)
-
-            # Get largest rectangular area in this line's histogram
-            area, start_idx, height, width = self.largest_hist_area(row_hist)
-            if area > maxArea:
-                maxArea = area
-                xmax_ref = i
-                ymax_ref = start_idx
-                xmin_ref = xmax_ref - height
-                ymin_ref = ymax_ref - width
-
+        
         # The returned value is the relative position in target area
         # Not the absolute position in map
-        return xmin_ref, xmax_ref, ymin_ref, ymax_ref
+        hist, stack = self._hist, self._stack
+        if np_map.shape[1] >= len(hist): # Wider than the region, use new buffers
+            hist = np.empty(np_map.shape[1]+1, dtype=np.int64)
+            stack = np.empty(np_map.shape[1]+1, dtype=np.int64)
+        if HAS_NUMBA:
+            xmin_ref, xmax_ref, ymin_ref, ymax_ref = _find_max_rectangle(np_map, hist, stack)
+        else:
+            xmin_ref, xmax_ref, ymin_ref, ymax_ref = _find_max_rectangle_numpy(np_map, hist, stack)
+        return int(xmin_ref), int(xmax_ref), int(ymin_ref), int(ymax_ref)
     
     def largest_hist_area(self, height):
         '''
@@ -222,28 +453,17 @@ class Region(object):
         Used for each line in the region map
         
         param:
-            height: list (each element means the height at that position)
-        '''
-        assert isinstance(height,list), "parameter height must be a list"
-        assert len(height)>0, "height list is empty"
-        
-        height.append(0)
-        stack = [-1]
-        maxArea = 0
-        save_idx = -1
-        save_h = -1
-        save_w = -1
-        for i in range(len(height)):
-            while height[i] < height[stack[-1]]:
-                h = height[stack.pop()]
-                w = i - stack[-1] - 1
-                if h * w > maxArea:
-                    maxArea = h * w
-                    save_idx = i
-                    save_h = h
-                    save_w = w
-            stack.append(i)
-        height.pop()
+            height: list or np.ndarray (each element means the height at that position)
+        '''
+        n = len(height)
+        
+        # Copy into a buffer with sentinel hist[n] = 0
+        hist = np.zeros(n+1, dtype=np.int64)
+        hist[:n] = height
+        out = np.empty(4, dtype=np.int64)
+        stack = np.empty(n+1, dtype=np.int64)
+        _largest_hist_area(hist, n, stack, out)
+        maxArea, save_idx, save_h, save_w = (int(v) for v in out)
         if maxArea == 0: return 0,0,0,0
         return maxArea, save_idx-1, save_h-1, save_w-1
         
@@ -251,13 +471,13 @@ class Region(object):
         '''
         Get current number of tower in region
         '''
-        return len(self.tower)
+        return self._n
     
     def get_cover_area(self):
         '''
         Get current covered area
         '''
-        return np.sum(self.map!=0)
+        return self._covered
         
     def auto_fill(self, max_try, n_tower, final_cover, show_overlap_process = False, show_text = False):
         '''
@@ -281,45 +501,74 @@ class Region(object):
         assert n_tower>0, "Please set n_tower>0"
         assert final_cover>0 and final_cover<=self.max_coverage, "Please set 0<final_cover<="+str(self.max_coverage)
         
+        return self._auto_fill_core(max_try, n_tower, final_cover, show_overlap_process, show_text)
+        
+    def _auto_fill_core(self, max_try, n_tower, final_cover, show_overlap_process = False, show_text = False):
+        '''
+        Auto fill process without any check
+        Parameters are assumed to be validated (see auto_fill)
+        '''
         # Start adding tower
         try_count = 0
+        xs, idx = [], 0
         while try_count < max_try:
             # Check finish condition
-            if self.get_tower_num() == self.max_tower: 
+            tower_num = self.get_tower_num()
+            if tower_num == self.max_tower: 
                 #print("Fullfilled !")
                 break # Already Fullfilled
-            if self.get_tower_num() == n_tower: 
+            if tower_num == n_tower: 
                 #print("Reach limitation for number of towers !")
                 break # Reach number of tower limitation
             if final_cover <= self.get_cover_area(): 
                 #print("Meet requirement for desired coverage !")
                 break # Reach desired coverage
                 
-            # Generate tower position and coverage randomly
-            # Based on uniform distribution
-            x_tmp = random.randint(0,self.x_range-1)
-            y_tmp = random.randint(0,self.y_range-1)
-            x_len_tmp = random.randint(1,self.x_range-x_tmp)
-            y_len_tmp = random.randint(1,self.y_range-y_tmp)
-            self.add_tower(x_tmp, y_tmp, x_len_tmp, y_len_tmp, 
-                           show_overlap=show_overlap_process,
-                          text=show_text)
+            # Take pre-generated tower position and coverage, refill when used up
+            if idx == len(xs):
+                xs, ys, x_lens, y_lens = self._draw_towers(min(max_try-try_count, 1024))
+                idx = 0
+            x_tmp, y_tmp = xs[idx], ys[idx]
+            x_len_tmp, y_len_tmp = x_lens[idx], y_lens[idx]
+            idx += 1
+            if show_overlap_process:
+                self.add_tower(x_tmp, y_tmp, x_len_tmp, y_len_tmp,
+                               show_overlap=True, text=show_text)
+            else:
+                self._add_tower_core(x_tmp, y_tmp, x_len_tmp, y_len_tmp)
             try_count += 1
             
         return try_count
             
+    def _draw_towers(self, size):
+        '''
+        Generate position and coverage of size towers randomly at once
+        Based on uniform distribution
+        
+        param:
+            size: int > 0, number of towers to generate
+        return:
+            xs, ys, x_lens, y_lens: list of int
+        '''
+        xs = self.rng.integers(0, self.x_range, size)
+        ys = self.rng.integers(0, self.y_range, size)
+        x_lens = self.rng.integers(1, self.x_range-xs+1)
+        y_lens = self.rng.integers(1, self.y_range-ys+1)
+        return xs.tolist(), ys.tolist(), x_lens.tolist(), y_lens.tolist()
+            
     def reset_map(self):
         '''
         Reset map to initial state
         Primarily used in batch expriment
         '''
-        self.map = np.zeros((self.x_range,self.y_range))
-        self.tower = []
-        self.sub_rectangle = []
+        self.map.fill(0)
+        self._n = 0
+        self._covered = 0
             
     def batch_experiment(self, n_exp, try_limit, tower_limit, desired_cover):
         '''
         Run n_exp times auto_fill experiment
+        With numba installed, experiments run in parallel, seeded from self.rng
         
         params:
             n_exp: int > 0 (number of experiment)
@@ -332,7 +581,20 @@ class Region(object):
             coverage_record: list (contains final coverage in map of each experiment)
         '''
         assert isinstance(n_exp,int), "n_exp must be int"
+        assert isinstance(try_limit,int), "try_limit must be int"
+        assert isinstance(tower_limit,int), "tower_limit must be int"
+        assert isinstance(desired_cover,int), "desired_cover must be int"
         assert n_exp>0, "Please set n_exp>0"
+        assert try_limit>0, "Please set try_limit>0"
+        assert tower_limit>0, "Please set tower_limit>0"
+        assert desired_cover>0 and desired_cover<=self.max_coverage, "Please set 0<desired_cover<="+str(self.max_coverage)
+        
+        if HAS_NUMBA: # Run experiments in parallel, each seeded from self.rng
+            self.reset_map()
+            seeds = self.rng.integers(0, 2**31-1, n_exp)
+            records = _batch_experiment(seeds, self.x_range, self.y_range,
+                                        try_limit, tower_limit, desired_cover)
+            return tuple(record.tolist() for record in records)
         
         num_try_record = []
         num_tower_record = []
@@ -340,7 +602,7 @@ class Region(object):
         self.reset_map()
         
         for count in range(n_exp):
-            n_try = self.auto_fill(try_limit, tower_limit, desired_cover)
+            n_try = self._auto_fill_core(try_limit, tower_limit, desired_cover)
             num_try_record.append(n_try)
             num_tower_record.append(self.get_tower_num())
             coverage_record.append(self.get_cover_area())